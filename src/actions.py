@@ -1,9 +1,18 @@
+import functools
+import json
 import logging
+import operator
 import random
+import re
 import time
-from typing import Any, Dict, List, Optional
-
-from selenium.common import TimeoutException, NoSuchElementException, ElementNotInteractableException
+import uuid
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from selenium.common import (TimeoutException, NoSuchElementException, ElementNotInteractableException,
+                             JavascriptException)
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
@@ -12,8 +21,16 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 
+# Serialized ActionResult fields; optional ones (selector, error) are omitted when empty
+_RESULT_KEYS = ('index', 'type', 'status', 'duration', 'message', 'selector', 'error')
+_REQUIRED_RESULT_KEYS = frozenset(('index', 'type', 'status', 'duration', 'message'))
+_result_fields = operator.attrgetter(*_RESULT_KEYS)
+
+
 class ActionResult:
     """Result of a single action execution"""
+    __slots__ = ('index', 'type', 'status', 'duration', 'message', 'selector', 'error')
+
     def __init__(self, index: int, action_type: str, status: str, duration: int = 0, 
                  message: str = "", selector: str = None, error: str = None):
         self.index = index
@@ -25,22 +42,13 @@ class ActionResult:
         self.error = error
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "index": self.index,
-            "type": self.type,
-            "status": self.status,
-            "duration": self.duration,
-            "message": self.message
-        }
-        if self.selector:
-            result["selector"] = self.selector
-        if self.error:
-            result["error"] = self.error
-        return result
+        return {k: v for k, v in zip(_RESULT_KEYS, _result_fields(self)) if v or k in _REQUIRED_RESULT_KEYS}
 
 
 class ActionExecutionResults:
     """Results of all actions execution"""
+    __slots__ = ('details', 'executed', 'successful', 'failed', 'skipped')
+
     def __init__(self):
         self.details: List[ActionResult] = []
         self.executed = 0
@@ -59,6 +67,14 @@ class ActionExecutionResults:
         elif result.status == 'skipped':
             self.skipped += 1
 
+    def add_many(self, results: List[ActionResult]):
+        self.details.extend(results)
+        counts = Counter(r.status for r in results)
+        self.successful += counts['success']
+        self.failed += counts['failed']
+        self.skipped += counts['skipped']
+        self.executed += counts['success'] + counts['failed']
+
     @property
     def summary(self) -> str:
         return f"{self.executed} executed, {self.successful} successful, {self.failed} failed, {self.skipped} skipped"
@@ -69,87 +85,255 @@ class ActionExecutionResults:
             "successful": self.successful,
             "failed": self.failed,
             "skipped": self.skipped,
-            "details": [r.to_dict() for r in self.details]
+            "details": [
+                {k: v for k, v in zip(_RESULT_KEYS, _result_fields(r)) if v or k in _REQUIRED_RESULT_KEYS}
+                for r in self.details
+            ]
         }
 
 
-def _get_element(driver: WebDriver, selector: str, timeout: int = 10):
-    """Find element by CSS selector or XPath"""
+@functools.lru_cache(maxsize=1024)
+def _locator(selector: str) -> Tuple[str, str]:
+    """Classify a selector as XPath or CSS and return the (by, value) locator"""
+    if selector[:1] == '/' or selector[:2] == '(/':
+        return By.XPATH, selector
+    return By.CSS_SELECTOR, selector
+
+
+# Implicit wait last applied to each session, so unchanged values cost no timeouts command
+_implicit_waits: 'weakref.WeakKeyDictionary[WebDriver, float]' = weakref.WeakKeyDictionary()
+
+
+def _set_implicit_wait(driver: WebDriver, seconds: float):
+    """Apply an implicit wait, skipping the command when the session already uses it"""
+    if _implicit_waits.get(driver) != seconds:
+        driver.implicitly_wait(seconds)
+        _implicit_waits[driver] = seconds
+
+
+@contextmanager
+def _restore_implicit_wait(driver: WebDriver):
+    """Let actions change the session implicit wait, restoring the previous value afterwards"""
+    previous = driver.timeouts.implicit_wait
+    _implicit_waits[driver] = previous
     try:
-        # Try CSS selector first
-        if selector.startswith('//') or selector.startswith('(//'):
-            # XPath
-            return WebDriverWait(driver, timeout / 1000.0).until(
-                EC.presence_of_element_located((By.XPATH, selector))
-            )
-        else:
-            # CSS selector
-            return WebDriverWait(driver, timeout / 1000.0).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
-    except TimeoutException:
+        yield
+    finally:
+        _set_implicit_wait(driver, previous)
+
+
+@contextmanager
+def _script_timeout(driver: WebDriver, seconds: float):
+    """Temporarily set the session async script timeout, restoring the previous value afterwards"""
+    previous = driver.timeouts.script
+    driver.set_script_timeout(seconds)
+    try:
+        yield
+    finally:
+        driver.set_script_timeout(previous)
+
+
+def _get_element(driver: WebDriver, selector: str, timeout: int = 10000):
+    """Find element by CSS selector or XPath, polling server-side for up to timeout ms"""
+    _set_implicit_wait(driver, timeout / 1000.0)
+    try:
+        return driver.find_element(*_locator(selector))
+    except NoSuchElementException:
         raise NoSuchElementException(f"Element not found: {selector}")
 
 
-def _element_exists(driver: WebDriver, selector: str) -> bool:
-    """Check if element exists in DOM"""
+def _get_element_in_view(driver: WebDriver, selector: str, timeout: int):
+    """Find element and scroll it into view"""
+    element = _get_element(driver, selector, timeout=timeout)
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+    return element
+
+
+def _idle_wait(driver: WebDriver, max_ms: int):
+    """Pause until document.readyState is complete, returning early instead of always sleeping max_ms"""
+    # Only readyState is checked. Requests still in flight after the load event are not tracked
     try:
-        if selector.startswith('//') or selector.startswith('(//'):
-            elements = driver.find_elements(By.XPATH, selector)
-        else:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-        return len(elements) > 0
+        WebDriverWait(driver, max_ms / 1000.0, poll_frequency=0.05).until(
+            lambda d: d.execute_script("return document.readyState === 'complete'")
+        )
     except Exception:
-        return False
+        # Page still busy after max_ms, carry on as the fixed pause did
+        pass
+
+
+# Shared JS helpers prepended to the condition and probe scripts: `find` resolves a
+# CSS selector or XPath to the first matching node, `visible` mirrors is_displayed()
+_CONDITION_JS_PRELUDE = """
+const find = (sel) => {
+    try {
+        return (sel.startsWith('/') || sel.startsWith('(/'))
+            ? document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(sel);
+    } catch (e) {
+        return null;
+    }
+};
+const visible = (el) => !!el && el.getClientRects().length > 0
+    && getComputedStyle(el).visibility !== 'hidden';
+"""
+
+
+_PROBE_JS = _CONDITION_JS_PRELUDE + """
+const el = find(arguments[0]);
+return el ? [true, visible(el)] : [false, false];
+"""
+
+
+def _probe(driver: WebDriver, selector: str) -> Tuple[bool, bool]:
+    """Check whether an element exists and is visible in a single round-trip"""
+    try:
+        exists, is_visible = driver.execute_script(_PROBE_JS, selector)
+        return bool(exists), bool(is_visible)
+    except Exception:
+        return False, False
+
+
+def _compile_condition_js(condition: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """Compile a condition into a single JS snippet returning a boolean, and its arguments"""
+    if 'ifTextMatches' in condition:
+        # null tells the caller the element is not there yet
+        body = ("const el = find(arguments[0]);"
+                " return el ? new RegExp(arguments[1]).test(el.innerText || el.textContent || '') : null;")
+        args = [condition['ifTextMatches'].get('selector'), condition['ifTextMatches'].get('pattern')]
+    elif 'ifUrlMatches' in condition:
+        body, args = "return new RegExp(arguments[0]).test(location.href);", [condition['ifUrlMatches']]
+    elif 'ifCustom' in condition:
+        # Custom conditions are function bodies, as with driver.execute_script()
+        body, args = f"return !!(function() {{ {condition['ifCustom']} \n}}).apply(this, arguments);", []
+    else:
+        body, args = "return true;", []
+    return _CONDITION_JS_PRELUDE + body, args
 
 
-def _element_visible(driver: WebDriver, selector: str) -> bool:
-    """Check if element is visible"""
+def _evaluate_js_condition(driver: WebDriver, condition: Dict[str, Any]) -> bool:
+    """Evaluate a compiled condition in a single browser round-trip"""
+    script, args = _compile_condition_js(condition)
     try:
-        if selector.startswith('//') or selector.startswith('(//'):
-            element = driver.find_element(By.XPATH, selector)
-        else:
-            element = driver.find_element(By.CSS_SELECTOR, selector)
-        return element.is_displayed()
+        result = driver.execute_script(script, *args)
+        if result is None and 'ifTextMatches' in condition:
+            # Give the element up to 2s to appear, as the WebDriver lookup used to
+            _get_element(driver, args[0], timeout=2000)
+            result = driver.execute_script(script, *args)
+        return bool(result)
+    except NoSuchElementException:
+        return False
     except Exception:
+        # JS RegExp rejects some Python syntax (inline flags, named groups), retry those here
+        if 'ifTextMatches' in condition or 'ifUrlMatches' in condition:
+            return _evaluate_regex_condition(driver, condition)
         return False
 
 
-def _evaluate_condition(driver: WebDriver, condition: Optional[Dict[str, Any]]) -> bool:
-    """Evaluate action condition"""
-    if not condition:
-        return True
+@functools.lru_cache(maxsize=256)
+def _rx(pattern: str) -> re.Pattern:
+    """Compile a condition regex once and reuse it"""
+    return re.compile(pattern)
+
 
-    if 'ifExists' in condition:
-        return _element_exists(driver, condition['ifExists'])
-    elif 'ifNotExists' in condition:
-        return not _element_exists(driver, condition['ifNotExists'])
-    elif 'ifVisible' in condition:
-        return _element_visible(driver, condition['ifVisible'])
-    elif 'ifHidden' in condition:
-        return not _element_visible(driver, condition['ifHidden'])
-    elif 'ifTextMatches' in condition:
-        import re
-        selector = condition['ifTextMatches'].get('selector')
-        pattern = condition['ifTextMatches'].get('pattern')
+def _evaluate_regex_condition(driver: WebDriver, condition: Dict[str, Any]) -> bool:
+    """Evaluate ifTextMatches / ifUrlMatches with Python regex semantics"""
+    if 'ifTextMatches' in condition:
         try:
+            selector = condition['ifTextMatches'].get('selector')
+            pattern = condition['ifTextMatches'].get('pattern')
             element = _get_element(driver, selector, timeout=2000)
-            return bool(re.search(pattern, element.text))
+            return bool(_rx(pattern).search(element.text))
         except Exception:
             return False
-    elif 'ifUrlMatches' in condition:
-        import re
-        pattern = condition['ifUrlMatches']
-        return bool(re.search(pattern, driver.current_url))
-    elif 'ifCustom' in condition:
-        # Execute custom JavaScript condition
+    # A pattern invalid in Python too raises re.error, failing the action
+    return bool(_rx(condition['ifUrlMatches']).search(driver.current_url))
+
+
+# Condition handlers in order of precedence, the first key present in a condition wins
+_CONDITION_HANDLERS = {
+    'ifExists': lambda driver, condition: _probe(driver, condition['ifExists'])[0],
+    'ifNotExists': lambda driver, condition: not _probe(driver, condition['ifNotExists'])[0],
+    'ifVisible': lambda driver, condition: _probe(driver, condition['ifVisible'])[1],
+    'ifHidden': lambda driver, condition: not _probe(driver, condition['ifHidden'])[1],
+    'ifTextMatches': _evaluate_js_condition,
+    'ifUrlMatches': _evaluate_js_condition,
+    'ifCustom': _evaluate_js_condition,
+}
+
+
+def _evaluate_condition(driver: WebDriver, condition: Dict[str, Any]) -> bool:
+    """Evaluate a non-empty action condition, callers skip the call when there is none"""
+    key = next((key for key in _CONDITION_HANDLERS if key in condition), None)
+    if key is None:
+        return True
+    return _CONDITION_HANDLERS[key](driver, condition)
+
+
+# Async scripts resolving their callback once the page reaches the given load state
+_LOAD_EVENT_JS = """
+const done = arguments[arguments.length - 1];
+if (document.readyState === 'complete') {
+    done();
+} else {
+    window.addEventListener('load', () => done(), {once: true});
+}
+"""
+
+_DOM_CONTENT_LOADED_EVENT_JS = """
+const done = arguments[arguments.length - 1];
+if (document.readyState !== 'loading') {
+    done();
+} else {
+    document.addEventListener('DOMContentLoaded', () => done(), {once: true});
+}
+"""
+
+# Resolves once location.href differs from arguments[0]. History events cover back/forward
+# and hash routing, the MutationObserver catches pushState-driven SPA route changes
+_URL_CHANGE_JS = """
+const start = arguments[0];
+const done = arguments[arguments.length - 1];
+const observer = new MutationObserver(() => check());
+const check = () => {
+    if (location.href === start) {
+        return false;
+    }
+    observer.disconnect();
+    ['popstate', 'hashchange'].forEach(e => window.removeEventListener(e, check));
+    done(location.href);
+    return true;
+};
+if (!check()) {
+    ['popstate', 'hashchange'].forEach(e => window.addEventListener(e, check));
+    observer.observe(document, {subtree: true, childList: true});
+}
+"""
+
+
+def _wait_in_browser(driver: WebDriver, script: str, timeout: float, *args):
+    """Block on an async script until it calls back, instead of polling from Python"""
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException(f"Timed out after {timeout}s waiting in browser")
         try:
-            result = driver.execute_script(condition['ifCustom'])
-            return bool(result)
-        except Exception:
-            return False
+            with _script_timeout(driver, remaining):
+                return driver.execute_async_script(script, *args)
+        except TimeoutException:
+            # Selenium reports a script timeout as TimeoutException, re-raise with context
+            raise TimeoutException(f"Timed out after {timeout}s waiting in browser")
+        except JavascriptException:
+            # The document was replaced before the callback fired, wait on the new one
+            continue
 
-    return True
+
+# Expected condition factories for the element states a wait action can target
+_STATE_EC = {
+    'visible': EC.visibility_of_element_located,
+    'hidden': EC.invisibility_of_element_located,
+    'present': EC.presence_of_element_located,
+}
 
 
 def _execute_wait_action(driver: WebDriver, action: Dict[str, Any]) -> str:
@@ -167,29 +351,17 @@ def _execute_wait_action(driver: WebDriver, action: Dict[str, Any]) -> str:
         state = wait_for.get('state', 'visible')
         timeout = wait_for.get('timeout', 10000) / 1000.0
         
-        if state == 'visible':
-            if selector.startswith('//') or selector.startswith('(//'):
-                WebDriverWait(driver, timeout).until(
-                    EC.visibility_of_element_located((By.XPATH, selector))
-                )
-            else:
-                WebDriverWait(driver, timeout).until(
-                    EC.visibility_of_element_located((By.CSS_SELECTOR, selector))
-                )
-            return f"Waited for element {selector} to be visible"
-        elif state == 'hidden':
-            if selector.startswith('//') or selector.startswith('(//'):
-                WebDriverWait(driver, timeout).until(
-                    EC.invisibility_of_element_located((By.XPATH, selector))
-                )
-            else:
-                WebDriverWait(driver, timeout).until(
-                    EC.invisibility_of_element_located((By.CSS_SELECTOR, selector))
-                )
-            return f"Waited for element {selector} to be hidden"
-        elif state == 'present':
-            _get_element(driver, selector, timeout=int(timeout * 1000))
-            return f"Waited for element {selector} to be present"
+        expected_condition = _STATE_EC.get(state)
+        if expected_condition is not None:
+            # Disable the implicit wait so it does not compound with the explicit one
+            _set_implicit_wait(driver, 0)
+            try:
+                WebDriverWait(driver, timeout).until(expected_condition(_locator(selector)))
+            except TimeoutException:
+                if state == 'present':
+                    raise NoSuchElementException(f"Element not found: {selector}")
+                raise TimeoutException(f"Element {selector} not {state} after {timeout}s")
+            return f"Waited for element {selector} to be {state}"
     
     # Event-based waits
     if 'event' in wait_for:
@@ -197,14 +369,10 @@ def _execute_wait_action(driver: WebDriver, action: Dict[str, Any]) -> str:
         timeout = wait_for.get('timeout', 30000) / 1000.0
         
         if event == 'load':
-            WebDriverWait(driver, timeout).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
-            )
+            _wait_in_browser(driver, _LOAD_EVENT_JS, timeout)
             return "Waited for page load"
         elif event == 'DOMContentLoaded':
-            WebDriverWait(driver, timeout).until(
-                lambda d: d.execute_script('return document.readyState') in ['interactive', 'complete']
-            )
+            _wait_in_browser(driver, _DOM_CONTENT_LOADED_EVENT_JS, timeout)
             return "Waited for DOM content loaded"
         
     
@@ -212,7 +380,7 @@ def _execute_wait_action(driver: WebDriver, action: Dict[str, Any]) -> str:
     if 'urlChange' in wait_for:
         current_url = driver.current_url
         timeout = wait_for.get('timeout', 10000) / 1000.0
-        WebDriverWait(driver, timeout).until(lambda d: d.current_url != current_url)
+        _wait_in_browser(driver, _URL_CHANGE_JS, timeout, current_url)
         return f"Waited for URL change from {current_url}"
     
     # Default: short wait
@@ -223,14 +391,9 @@ def _execute_wait_action(driver: WebDriver, action: Dict[str, Any]) -> str:
 def _execute_click_action(driver: WebDriver, action: Dict[str, Any]) -> str:
     """Execute click action with stealth patterns"""
     selector = action['selector']
-    timeout = action.get('timeout', 10000)
-    
-    # Wait for element to be clickable
-    element = _get_element(driver, selector, timeout=timeout)
-    
-    # Scroll element into view
-    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-    time.sleep(random.uniform(0.1, 0.3))  # Random pause after scroll
+    # Wait for element to be clickable and scroll it into view
+    element = _get_element_in_view(driver, selector, action.get('timeout', 10000))
+    _idle_wait(driver, random.randint(100, 300))  # Random pause after scroll
     
     # Use ActionChains for human-like clicking
     actions = ActionChains(driver)
@@ -248,29 +411,25 @@ def _execute_type_action(driver: WebDriver, action: Dict[str, Any]) -> str:
     """Execute type action with human-like typing"""
     selector = action['selector']
     value = action['value']
-    timeout = action.get('timeout', 10000)
     clear = action.get('clear', True)
     
-    # Wait for element
-    element = _get_element(driver, selector, timeout=timeout)
-    
-    # Scroll into view and focus
-    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-    time.sleep(random.uniform(0.1, 0.2))
+    # Wait for element and scroll it into view
+    element = _get_element_in_view(driver, selector, action.get('timeout', 10000))
+    _idle_wait(driver, random.randint(100, 200))
     
     # Clear existing text if requested
     if clear:
         element.clear()
-        time.sleep(random.uniform(0.05, 0.15))
+        _idle_wait(driver, random.randint(50, 150))
     
     # Use ActionChains for human-like typing
     actions = ActionChains(driver)
     actions.click(element)
     
-    # Type with random delays between characters
+    # Type with random delays between characters. The ticks go on the key source only,
+    # so unlike send_keys() + pause() no pointer pause is added per character
     for char in value:
-        actions.send_keys(char)
-        actions.pause(random.uniform(0.05, 0.15))
+        actions.w3c_actions.key_action.key_down(char).key_up(char).pause(0.05 + random.random() * 0.1)
     
     actions.perform()
     
@@ -287,19 +446,14 @@ def _execute_execute_script_action(driver: WebDriver, action: Dict[str, Any]) ->
 def _execute_press_enter_action(driver: WebDriver, action: Dict[str, Any]) -> str:
     """Execute press enter action on an element or active element"""
     selector = action.get('selector')
-    timeout = action.get('timeout', 10000)
-    
     if selector:
         # Press enter on a specific element
-        element = _get_element(driver, selector, timeout=timeout)
-        
-        # Scroll into view
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-        time.sleep(random.uniform(0.1, 0.2))
+        element = _get_element_in_view(driver, selector, action.get('timeout', 10000))
+        _idle_wait(driver, random.randint(100, 200))
         
         # Use ActionChains to send Enter key
         actions = ActionChains(driver)
-        actions.click(element).pause(random.uniform(0.05, 0.15))
+        actions.click(element).pause(0.05 + random.random() * 0.1)
         actions.send_keys(Keys.ENTER).perform()
         
         return f"Pressed Enter on {selector}"
@@ -311,17 +465,26 @@ def _execute_press_enter_action(driver: WebDriver, action: Dict[str, Any]) -> st
         return "Pressed Enter on active element"
 
 
+_ACTION_HANDLERS = {
+    'wait': _execute_wait_action,
+    'click': _execute_click_action,
+    'type': _execute_type_action,
+    'press_enter': _execute_press_enter_action,
+    'execute_script': _execute_execute_script_action,
+}
+
+
 def _execute_single_action(driver: WebDriver, action: Dict[str, Any], index: int) -> ActionResult:
     """Execute a single action"""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     action_type = action.get('type')
     selector = action.get('selector')
     
     try:
         # Evaluate condition
         condition = action.get('condition')
-        if not _evaluate_condition(driver, condition):
-            duration = int((time.time() - start_time) * 1000)
+        if condition and not _evaluate_condition(driver, condition):
+            duration = (time.perf_counter_ns() - start_ns) // 1_000_000
             return ActionResult(
                 index=index,
                 action_type=action_type,
@@ -332,25 +495,17 @@ def _execute_single_action(driver: WebDriver, action: Dict[str, Any], index: int
             )
         
         # Execute action based on type
-        if action_type == 'wait':
-            message = _execute_wait_action(driver, action)
-        elif action_type == 'click':
-            message = _execute_click_action(driver, action)
-        elif action_type == 'type':
-            message = _execute_type_action(driver, action)
-        elif action_type == 'press_enter':
-            message = _execute_press_enter_action(driver, action)
-        elif action_type == 'execute_script':
-            message = _execute_execute_script_action(driver, action)
-        else:
+        handler = _ACTION_HANDLERS.get(action_type)
+        if handler is None:
             raise ValueError(f"Unknown action type: {action_type}")
+        message = handler(driver, action)
         
         # Wait after action if specified
         wait_after = action.get('waitAfter', 0)
         if wait_after > 0:
             time.sleep(wait_after / 1000.0)
         
-        duration = int((time.time() - start_time) * 1000)
+        duration = (time.perf_counter_ns() - start_ns) // 1_000_000
         return ActionResult(
             index=index,
             action_type=action_type,
@@ -361,7 +516,7 @@ def _execute_single_action(driver: WebDriver, action: Dict[str, Any], index: int
         )
         
     except Exception as e:
-        duration = int((time.time() - start_time) * 1000)
+        duration = (time.perf_counter_ns() - start_ns) // 1_000_000
         error_msg = str(e)
         logging.warning(f"Action {index} ({action_type}) failed: {error_msg}")
         
@@ -386,20 +541,23 @@ def _execute_action_group(driver: WebDriver, action_group: Dict[str, Any],
     if group_condition and not _evaluate_condition(driver, group_condition):
         # Skip entire group
         steps = action_group.get('steps', [])
-        for i, step in enumerate(steps):
-            result = ActionResult(
+        results = [
+            ActionResult(
                 index=base_index + i,
                 action_type=step.get('type', 'unknown'),
                 status='skipped',
-                message=f"Group condition not met",
+                message="Group condition not met",
                 selector=step.get('selector')
             )
-            results.append(result)
+            for i, step in enumerate(steps)
+        ]
         return results, len(steps)
     
     # Execute steps in the group
     steps = action_group.get('steps', [])
     continue_on_group_error = action_group.get('continueOnError', False)
+    # Pauses between steps (100-300ms) drawn up front for the whole group
+    pauses = iter([100 + int(random.random() * 200) for _ in steps])
     
     for i, step in enumerate(steps):
         result = _execute_single_action(driver, step, base_index + i)
@@ -411,59 +569,378 @@ def _execute_action_group(driver: WebDriver, action_group: Dict[str, Any],
             if not continue_on_error:
                 # Stop executing remaining steps in this group
                 # Mark remaining steps as skipped
-                for j in range(i + 1, len(steps)):
-                    skipped = ActionResult(
+                results.extend(
+                    ActionResult(
                         index=base_index + j,
                         action_type=steps[j].get('type', 'unknown'),
                         status='skipped',
-                        message=f"Skipped due to previous failure",
+                        message="Skipped due to previous failure",
                         selector=steps[j].get('selector')
                     )
-                    results.append(skipped)
+                    for j in range(i + 1, len(steps))
+                )
                 break
         
         # Add small random pause between actions for stealth
-        time.sleep(random.uniform(0.1, 0.3))
+        _idle_wait(driver, next(pauses))
     
     return results, len(steps)
 
 
-def execute_actions(actions: List[Dict[str, Any]], driver: WebDriver) -> ActionExecutionResults:
+# Action types the in-browser runner supports; anything else uses the WebDriver path
+_IN_BROWSER_ACTION_TYPES = frozenset(('click', 'type', 'press_enter', 'wait'))
+
+# Async runner executing a whole action list inside the page. Actions arrive as
+# arguments[0], the sessionStorage key its progress is saved under as arguments[1],
+# and per-action {status, duration, message, error} outcomes are returned
+_IN_BROWSER_ACTIONS_JS = _CONDITION_JS_PRELUDE + """
+const actions = arguments[0];
+const progressKey = arguments[1];
+const done = arguments[arguments.length - 1];
+// Outcomes are saved after every action so they survive a navigation or a script timeout
+const saveProgress = (outcomes) => {
+    try {
+        sessionStorage.setItem(progressKey, JSON.stringify(outcomes));
+    } catch (e) {}
+};
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+const jitter = (min, max) => min + Math.random() * (max - min);
+const states = {
+    present: (el) => !!el,
+    visible: (el) => visible(el),
+    hidden: (el) => !visible(el),
+};
+
+// Resolve once the selector satisfies the predicate, re-checking on DOM mutations
+const waitFor = (sel, timeout, predicate) => new Promise((resolve, reject) => {
+    let observer = null;
+    let poller = null;
+    let timer = null;
+    const stop = () => {
+        if (observer) observer.disconnect();
+        clearInterval(poller);
+        clearTimeout(timer);
+    };
+    const check = () => {
+        const el = find(sel);
+        if (!predicate(el)) {
+            return false;
+        }
+        stop();
+        resolve(el);
+        return true;
+    };
+    if (check()) {
+        return;
+    }
+    observer = new MutationObserver(check);
+    observer.observe(document, {subtree: true, childList: true, attributes: true});
+    // Layout-only changes (stylesheets, images) do not trigger mutations
+    poller = setInterval(check, 250);
+    timer = setTimeout(() => {
+        stop();
+        reject(new Error(`Element not found: ${sel}`));
+    }, timeout);
+});
+
+const scrollIntoView = async (el, min, max) => {
+    el.scrollIntoView({block: 'center'});
+    await sleep(jitter(min, max));
+};
+const mouse = (el, type) => {
+    const rect = el.getBoundingClientRect();
+    return el.dispatchEvent(new MouseEvent(type, {
+        bubbles: true, cancelable: true, view: window, button: 0,
+        clientX: rect.left + rect.width / 2 + jitter(-5, 5),
+        clientY: rect.top + rect.height / 2 + jitter(-5, 5),
+    }));
+};
+const key = (el, type, k) => el.dispatchEvent(new KeyboardEvent(type, {key: k, bubbles: true, cancelable: true}));
+// The native value setter, used so framework-controlled inputs (React, etc.) notice the
+// change. Elements without one, such as contenteditable, cannot be typed into this way
+const valueSetter = (el) => {
+    for (let proto = Object.getPrototypeOf(el); proto; proto = Object.getPrototypeOf(proto)) {
+        const descriptor = Object.getOwnPropertyDescriptor(proto, 'value');
+        if (descriptor) {
+            return descriptor.set || null;
+        }
+    }
+    return null;
+};
+
+const handlers = {
+    click: async (action) => {
+        const el = await waitFor(action.selector, action.timeout, states.present);
+        await scrollIntoView(el, 100, 300);
+        ['mouseover', 'mousedown', 'mouseup', 'click'].forEach(type => mouse(el, type));
+        return `Clicked element ${action.selector}`;
+    },
+    type: async (action) => {
+        if (action.value === null) {
+            throw new Error(`No value to type into ${action.selector}`);
+        }
+        const el = await waitFor(action.selector, action.timeout, states.present);
+        const setValue = valueSetter(el);
+        if (!setValue) {
+            throw new Error(`Element ${action.selector} has no value to type into`);
+        }
+        await scrollIntoView(el, 100, 200);
+        el.focus();
+        if (action.clear) {
+            setValue.call(el, '');
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            await sleep(jitter(50, 150));
+        }
+        for (const c of action.value) {
+            key(el, 'keydown', c);
+            key(el, 'keypress', c);
+            setValue.call(el, el.value + c);
+            el.dispatchEvent(new InputEvent('input', {bubbles: true, data: c, inputType: 'insertText'}));
+            key(el, 'keyup', c);
+            await sleep(jitter(50, 150));
+        }
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        return `Typed into ${action.selector}`;
+    },
+    press_enter: async (action) => {
+        let el = document.activeElement || document.body;
+        if (action.selector) {
+            el = await waitFor(action.selector, action.timeout, states.present);
+            await scrollIntoView(el, 100, 200);
+            el.focus();
+            await sleep(jitter(50, 150));
+        }
+        const proceed = key(el, 'keydown', 'Enter');
+        key(el, 'keypress', 'Enter');
+        key(el, 'keyup', 'Enter');
+        // Synthetic key events do not trigger implicit form submission
+        if (proceed && el.tagName === 'INPUT' && el.form) {
+            el.form.requestSubmit();
+        }
+        return action.selector ? `Pressed Enter on ${action.selector}` : 'Pressed Enter on active element';
+    },
+    wait: async (action) => {
+        const waitFor_ = action.for;
+        if ('time' in waitFor_) {
+            await sleep(waitFor_.time);
+            return `Waited ${waitFor_.time}ms`;
+        }
+        const state = waitFor_.state ?? 'visible';
+        if ('selector' in waitFor_ && state in states) {
+            await waitFor(waitFor_.selector, waitFor_.timeout ?? 10000, states[state]);
+            return `Waited for element ${waitFor_.selector} to be ${state}`;
+        }
+        await sleep(500);
+        return 'Default wait executed';
+    },
+};
+
+(async () => {
+    const outcomes = [];
+    for (let i = 0; i < actions.length; i++) {
+        // Set once the caller has given up on this run
+        if (window[progressKey]) {
+            return;
+        }
+        const action = actions[i];
+        const start = performance.now();
+        try {
+            const message = await handlers[action.type](action);
+            if (action.waitAfter > 0) {
+                await sleep(action.waitAfter);
+            }
+            outcomes.push({status: 'success', duration: Math.floor(performance.now() - start), message});
+        } catch (e) {
+            const error = e && e.message ? e.message : String(e);
+            outcomes.push({
+                status: 'failed', duration: Math.floor(performance.now() - start),
+                message: `Action failed: ${error}`, error,
+            });
+            if (!action.continueOnError) {
+                break;
+            }
+        }
+        saveProgress(outcomes);
+        // Pause between actions only, the last one may have started a navigation
+        if (i < actions.length - 1) {
+            await sleep(jitter(100, 300));
+        }
+    }
+    try {
+        sessionStorage.removeItem(progressKey);
+    } catch (e) {}
+    done(outcomes);
+})();
+"""
+
+
+def _can_run_in_browser(actions: List[Dict[str, Any]]) -> bool:
+    """Whether every action is a plain DOM interaction the in-browser runner supports"""
+    return all(
+        action.get('type') in _IN_BROWSER_ACTION_TYPES
+        and 'condition' not in action
+        and 'event' not in action.get('for', {})
+        and 'urlChange' not in action.get('for', {})
+        for action in actions
+    )
+
+
+def _compile_actions_to_js(actions: List[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+    """Compile DOM-only actions into the in-browser runner script and its arguments"""
+    steps = [
+        {
+            'type': action['type'],
+            'selector': action.get('selector'),
+            'value': action.get('value'),
+            'timeout': action.get('timeout', 10000),
+            'clear': action.get('clear', True),
+            'for': action.get('for', {}),
+            'waitAfter': action.get('waitAfter', 0),
+            'continueOnError': action.get('continueOnError', False),
+        }
+        for action in actions
+    ]
+    return _IN_BROWSER_ACTIONS_JS, [steps, f"flaresolverr-actions-{uuid.uuid4().hex}"]
+
+
+def _in_browser_script_timeout(actions: List[Dict[str, Any]]) -> float:
+    """Upper bound on the in-browser runner's duration, in seconds"""
+    total = 0
+    for action in actions:
+        wait_for = action.get('for', {})
+        total += (action.get('timeout', 10000) + wait_for.get('time', 0) + wait_for.get('timeout', 10000)
+                  + action.get('waitAfter', 0) + 150 * len(str(action.get('value') or '')) + 1000)
+    return total / 1000.0
+
+
+_RECOVER_PROGRESS_JS = """
+const [progressKey] = arguments;
+window[progressKey] = true;
+const saved = sessionStorage.getItem(progressKey);
+sessionStorage.removeItem(progressKey);
+return saved;
+"""
+
+
+def _recover_in_browser_outcomes(driver: WebDriver, progress_key: str) -> List[Dict[str, Any]]:
+    """Stop an interrupted in-browser run and return the outcomes it saved, if any survived"""
+    try:
+        saved = driver.execute_script(_RECOVER_PROGRESS_JS, progress_key)
+        return json.loads(saved) if saved else []
+    except Exception as e:
+        logging.debug(f"Could not recover in-browser action outcomes: {e}")
+        return []
+
+
+def _in_browser_results(actions: List[Dict[str, Any]], outcomes: List[Dict[str, Any]],
+                        error_msg: Optional[str] = None) -> ActionExecutionResults:
+    """
+    Map the in-browser runner's outcomes to action results
+
+    When the run was interrupted with error_msg, the action that was in flight is reported
+    as failed and the ones after it as skipped
+    """
+    results = ActionExecutionResults()
+    results.add_many([
+        ActionResult(
+            index=i,
+            action_type=action['type'],
+            status=outcome['status'],
+            duration=outcome['duration'],
+            message=outcome['message'],
+            selector=action.get('selector'),
+            error=outcome.get('error')
+        )
+        for i, (action, outcome) in enumerate(zip(actions, outcomes))
+    ])
+    current = len(outcomes)
+    if current >= len(actions):
+        return results
+
+    stopped = current > 0 and outcomes[-1]['status'] == 'failed' and not actions[current - 1].get('continueOnError', False)
+    if error_msg is None or stopped:
+        logging.error(f"Stopping action execution due to failure at index {current - 1}")
+        return results
+
+    results.add_result(ActionResult(
+        index=current,
+        action_type=actions[current]['type'],
+        status='failed',
+        message=f"Action failed: {error_msg}",
+        selector=actions[current].get('selector'),
+        error=error_msg
+    ))
+    results.add_many([
+        ActionResult(
+            index=i,
+            action_type=action['type'],
+            status='skipped',
+            message="Skipped after the in-browser run was interrupted",
+            selector=action.get('selector')
+        )
+        for i, action in enumerate(actions[current + 1:], start=current + 1)
+    ])
+    return results
+
+
+def _execute_actions_in_browser(actions: List[Dict[str, Any]], driver: WebDriver) -> ActionExecutionResults:
+    """Execute DOM-only actions in a single execute_async_script call"""
+    script, args = _compile_actions_to_js(actions)
+    try:
+        with _script_timeout(driver, _in_browser_script_timeout(actions)):
+            outcomes = driver.execute_async_script(script, *args)
+    except Exception as e:
+        # The page navigated away mid-run or the script timed out, keep what the runner saved
+        error_msg = str(e)
+        logging.warning(f"In-browser action execution failed: {error_msg}")
+        return _in_browser_results(actions, _recover_in_browser_outcomes(driver, args[1]), error_msg)
+    return _in_browser_results(actions, outcomes)
+
+
+def execute_actions(actions: List[Dict[str, Any]], driver: WebDriver,
+                    in_browser: bool = False) -> ActionExecutionResults:
     """
     Execute a list of actions on the WebDriver
     
     Args:
         actions: List of action definitions or action groups
         driver: Selenium WebDriver instance
+        in_browser: Run the whole list as one in-page script when it only holds click, type,
+            press_enter and time/selector waits without conditions. Its events are synthetic
+            (isTrusted is false) and a navigation before the last action loses the results
         
     Returns:
         ActionExecutionResults with execution details
     """
+    if in_browser and _can_run_in_browser(actions):
+        return _execute_actions_in_browser(actions, driver)
+
     results = ActionExecutionResults()
     current_index = 0
     
-    for action in actions:
-        # Check if this is an action group (has 'steps' key) or single action
-        if 'steps' in action:
-            # This is an action group
-            group_results, steps_count = _execute_action_group(driver, action, current_index)
-            for result in group_results:
+    # Element lookups poll server-side, with the implicit wait set to each action's timeout
+    with _restore_implicit_wait(driver):
+        for action in actions:
+            # Check if this is an action group (has 'steps' key) or single action
+            if 'steps' in action:
+                # This is an action group
+                group_results, steps_count = _execute_action_group(driver, action, current_index)
+                results.add_many(group_results)
+                current_index += steps_count
+            else:
+                # Single action
+                result = _execute_single_action(driver, action, current_index)
                 results.add_result(result)
-            current_index += steps_count
-        else:
-            # Single action
-            result = _execute_single_action(driver, action, current_index)
-            results.add_result(result)
-            current_index += 1
-            
-            # Check if we should stop on error
-            if result.status == 'failed':
-                continue_on_error = action.get('continueOnError', False)
-                if not continue_on_error:
-                    logging.error(f"Stopping action execution due to failure at index {result.index}")
-                    break
-            
-            # Add small random pause between actions
-            time.sleep(random.uniform(0.1, 0.3))
+                current_index += 1
+                
+                # Check if we should stop on error
+                if result.status == 'failed':
+                    continue_on_error = action.get('continueOnError', False)
+                    if not continue_on_error:
+                        logging.error(f"Stopping action execution due to failure at index {result.index}")
+                        break
+                
+                # Add small random pause between actions
+                _idle_wait(driver, random.randint(100, 300))
     
     return results
@@ -54,6 +54,8 @@ class V1RequestBase(object):
     tabs_till_verify : int = None
     # Optional post-challenge page interactions
     actions: list = None
+    # Optional, run DOM-only actions as a single in-page script instead of WebDriver input
+    actionsInBrowser: bool = None
 
     def __init__(self, _dict):
         self.__dict__.update(_dict)
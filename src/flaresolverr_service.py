@@ -469,7 +469,7 @@ def _evil_logic(req: V1RequestBase, driver: WebDriver, method: str) -> Challenge
     if req.actions is not None and len(req.actions) > 0:
         logging.info(f"Executing {len(req.actions)} post-challenge action(s)...")
         try:
-            action_results = execute_actions(req.actions, driver)
+            action_results = execute_actions(req.actions, driver, in_browser=bool(req.actionsInBrowser))
             logging.info(f"Actions completed: {action_results.summary}")
             
             # Raise exception if any actions failed
@@ -0,0 +1,291 @@
+import json
+import unittest
+from types import SimpleNamespace
+
+from selenium.common import JavascriptException, NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+import actions
+
+
+class FakeDriver:
+    """Stand-in for a WebDriver session that records the commands it receives"""
+
+    def __init__(self, script_handler=None, async_script_handler=None):
+        self.script_handler = script_handler or (lambda script, args: True)
+        self.async_script_handler = async_script_handler or (lambda script, args: [])
+        self.commands = []
+        self.payloads = []
+        self.implicit_wait = 0
+        self.applied_implicit_waits = []
+        self.script_timeout = 30
+        self.current_url = 'https://example.com/'
+
+    @property
+    def timeouts(self):
+        return SimpleNamespace(implicit_wait=self.implicit_wait, script=self.script_timeout)
+
+    def _command(self, name, handler):
+        self.commands.append(name)
+        return handler()
+
+    def execute_script(self, script, *args):
+        return self._command('execute_script', lambda: self.script_handler(script, args))
+
+    def execute_async_script(self, script, *args):
+        return self._command('execute_async_script', lambda: self.async_script_handler(script, args))
+
+    def find_element(self, by, value):
+        return self._command('find_element', lambda: WebElement(self, value))
+
+    def execute(self, command, params=None):
+        self.payloads.append(params)
+        return self._command(command, lambda: {'value': None})
+
+    def implicitly_wait(self, seconds):
+        self._command('implicitly_wait', lambda: None)
+        self.implicit_wait = seconds
+        self.applied_implicit_waits.append(seconds)
+
+    def set_script_timeout(self, seconds):
+        self._command('set_script_timeout', lambda: None)
+        self.script_timeout = seconds
+
+
+class TestActions(unittest.TestCase):
+
+    def test_module_imports(self):
+        self.assertTrue(callable(actions.execute_actions))
+
+    def test_locator(self):
+        self.assertEqual((By.XPATH, '//div[@id="a"]'), actions._locator('//div[@id="a"]'))
+        self.assertEqual((By.XPATH, '(//a)[2]'), actions._locator('(//a)[2]'))
+        self.assertEqual((By.XPATH, '/html/body'), actions._locator('/html/body'))
+        self.assertEqual((By.CSS_SELECTOR, '#a > .b'), actions._locator('#a > .b'))
+        self.assertEqual((By.CSS_SELECTOR, '(a)'), actions._locator('(a)'))
+
+    def test_add_many_counts_like_add_result(self):
+        statuses = ['success', 'failed', 'skipped', 'success', 'skipped', 'unknown']
+        one_by_one = actions.ActionExecutionResults()
+        for i, status in enumerate(statuses):
+            one_by_one.add_result(actions.ActionResult(index=i, action_type='click', status=status))
+        batched = actions.ActionExecutionResults()
+        batched.add_many([actions.ActionResult(index=i, action_type='click', status=status)
+                          for i, status in enumerate(statuses)])
+
+        self.assertEqual((3, 2, 1, 2), (batched.executed, batched.successful, batched.failed, batched.skipped))
+        self.assertEqual(one_by_one.to_dict(), batched.to_dict())
+        self.assertEqual("3 executed, 2 successful, 1 failed, 2 skipped", batched.summary)
+
+    def test_to_dict(self):
+        results = actions.ActionExecutionResults()
+        results.add_many([
+            actions.ActionResult(index=0, action_type='click', status='success', duration=12,
+                                 message="Clicked #a", selector='#a'),
+            actions.ActionResult(index=1, action_type='wait', status='failed', message="Action failed: boom",
+                                 error='boom'),
+            actions.ActionResult(index=2, action_type='press_enter', status='skipped', selector=''),
+        ])
+        expected_details = [
+            {'index': 0, 'type': 'click', 'status': 'success', 'duration': 12, 'message': "Clicked #a",
+             'selector': '#a'},
+            {'index': 1, 'type': 'wait', 'status': 'failed', 'duration': 0, 'message': "Action failed: boom",
+             'error': 'boom'},
+            {'index': 2, 'type': 'press_enter', 'status': 'skipped', 'duration': 0, 'message': ''},
+        ]
+
+        self.assertEqual(expected_details, [result.to_dict() for result in results.details])
+        self.assertEqual(list(expected_details[0]), list(results.details[0].to_dict()))
+        self.assertEqual({'executed': 2, 'successful': 1, 'failed': 1, 'skipped': 1, 'details': expected_details},
+                         results.to_dict())
+        self.assertEqual(['executed', 'successful', 'failed', 'skipped', 'details'], list(results.to_dict()))
+
+    def test_type_action_sends_click_and_keys_in_one_payload(self):
+        driver = FakeDriver()
+        message = actions._execute_type_action(driver, {'selector': '#q', 'value': 'ab', 'clear': False})
+
+        self.assertEqual("Typed into #q", message)
+        self.assertEqual(1, len(driver.payloads))
+        sources = {source['type']: source['actions'] for source in driver.payloads[0]['actions']}
+        self.assertIn('pointerDown', [tick['type'] for tick in sources['pointer']])
+        typed = [tick['value'] for tick in sources['key'] if tick['type'] == 'keyDown']
+        self.assertEqual(['a', 'b'], typed)
+
+    def test_element_lookups_use_each_action_timeout(self):
+        driver = FakeDriver()
+        driver.implicit_wait = 5
+        results = actions.execute_actions([
+            {'type': 'click', 'selector': '#a', 'timeout': 1000},
+            {'type': 'click', 'selector': '#b', 'timeout': 1000},
+            {'type': 'click', 'selector': '#c', 'timeout': 30000},
+        ], driver)
+
+        self.assertEqual(3, results.successful)
+        # Unchanged timeouts are not re-sent, and the session's own value is restored
+        self.assertEqual([1.0, 30.0, 5], driver.applied_implicit_waits)
+
+    def test_regex_condition_fallback_waits_at_most_two_seconds(self):
+        driver = FakeDriver()
+        actions._evaluate_regex_condition(driver, {'ifTextMatches': {'selector': '#a', 'pattern': '(?i)x'}})
+        self.assertEqual([2.0], driver.applied_implicit_waits)
+
+    def test_compile_condition_js(self):
+        script, args = actions._compile_condition_js({'ifTextMatches': {'selector': '#a', 'pattern': 'ok'}})
+        self.assertTrue(script.startswith(actions._CONDITION_JS_PRELUDE))
+        self.assertEqual(['#a', 'ok'], args)
+
+        script, args = actions._compile_condition_js({'ifUrlMatches': 'example'})
+        self.assertIn('location.href', script)
+        self.assertEqual(['example'], args)
+
+        script, args = actions._compile_condition_js({'ifCustom': 'return 1 // trailing comment'})
+        self.assertIn('return 1 // trailing comment \n}', script)
+        self.assertEqual([], args)
+
+    def test_text_condition_waits_for_the_element(self):
+        outcomes = iter([None, True])
+        driver = FakeDriver(lambda script, args: next(outcomes))
+        condition = {'ifTextMatches': {'selector': '#a', 'pattern': 'ok'}}
+
+        self.assertTrue(actions._evaluate_condition(driver, condition))
+        self.assertEqual([2.0], driver.applied_implicit_waits)
+
+    def test_invalid_url_pattern_fails_the_action(self):
+        def script_handler(script, args):
+            raise JavascriptException("Invalid regular expression")
+
+        driver = FakeDriver(script_handler)
+        result = actions._execute_single_action(driver, {'type': 'wait', 'for': {'time': 0},
+                                                         'condition': {'ifUrlMatches': '('}}, 0)
+        self.assertEqual('failed', result.status)
+
+    def test_url_pattern_rejected_by_js_falls_back_to_python(self):
+        def script_handler(script, args):
+            raise JavascriptException("Invalid regular expression")
+
+        driver = FakeDriver(script_handler)
+        self.assertTrue(actions._evaluate_condition(driver, {'ifUrlMatches': '(?i)EXAMPLE'}))
+
+    def test_load_event_waits_block_in_the_browser(self):
+        scripts = []
+        driver = FakeDriver(async_script_handler=lambda script, args: scripts.append(script))
+
+        self.assertEqual("Waited for page load",
+                         actions._execute_wait_action(driver, {'for': {'event': 'load'}}))
+        self.assertEqual("Waited for DOM content loaded",
+                         actions._execute_wait_action(driver, {'for': {'event': 'DOMContentLoaded'}}))
+        self.assertEqual([actions._LOAD_EVENT_JS, actions._DOM_CONTENT_LOADED_EVENT_JS], scripts)
+        self.assertEqual(30, driver.script_timeout)
+
+    def test_url_change_wait_rearms_after_unload(self):
+        calls = []
+
+        def async_script_handler(script, args):
+            calls.append(args)
+            if len(calls) == 1:
+                # The navigation replaced the document the first script ran in
+                raise JavascriptException("javascript error: document unloaded while waiting for result")
+            return 'https://example.com/next'
+
+        driver = FakeDriver(async_script_handler=async_script_handler)
+        result = actions._execute_single_action(driver, {'type': 'wait', 'for': {'urlChange': True}}, 0)
+
+        self.assertEqual('success', result.status)
+        self.assertEqual("Waited for URL change from https://example.com/", result.message)
+        self.assertEqual([('https://example.com/',), ('https://example.com/',)], calls)
+        self.assertEqual(30, driver.script_timeout)
+
+    def test_script_timeout_fails_the_wait_and_restores_the_script_timeout(self):
+        def async_script_handler(script, args):
+            raise TimeoutException("script timeout")
+
+        driver = FakeDriver(async_script_handler=async_script_handler)
+        result = actions._execute_single_action(driver, {'type': 'wait', 'for': {'urlChange': True,
+                                                                                 'timeout': 2000}}, 0)
+
+        self.assertEqual('failed', result.status)
+        self.assertIn("Timed out after 2.0s waiting in browser", result.error)
+        self.assertEqual(['set_script_timeout', 'execute_async_script', 'set_script_timeout'], driver.commands)
+        self.assertEqual(30, driver.script_timeout)
+
+    def test_can_run_in_browser(self):
+        self.assertTrue(actions._can_run_in_browser([
+            {'type': 'click', 'selector': '#a'},
+            {'type': 'type', 'selector': '#q', 'value': 'x'},
+            {'type': 'press_enter'},
+            {'type': 'wait', 'for': {'time': 100}},
+        ]))
+        self.assertFalse(actions._can_run_in_browser([{'type': 'execute_script', 'value': 'return 1'}]))
+        self.assertFalse(actions._can_run_in_browser([{'type': 'click', 'selector': '#a',
+                                                       'condition': {'ifUrlMatches': 'x'}}]))
+        self.assertFalse(actions._can_run_in_browser([{'steps': [{'type': 'click', 'selector': '#a'}]}]))
+
+    def test_compile_actions_to_js(self):
+        script, args = actions._compile_actions_to_js([{'type': 'click', 'selector': '#a'}])
+        self.assertEqual(actions._IN_BROWSER_ACTIONS_JS, script)
+        steps, progress_key = args
+        self.assertEqual([{
+            'type': 'click', 'selector': '#a', 'value': None, 'timeout': 10000, 'clear': True,
+            'for': {}, 'waitAfter': 0, 'continueOnError': False,
+        }], steps)
+        self.assertNotEqual(progress_key, actions._compile_actions_to_js([])[1][1])
+
+    def test_in_browser_results(self):
+        steps = [{'type': 'click', 'selector': '#a'}, {'type': 'click', 'selector': '#b'},
+                 {'type': 'press_enter'}]
+        succeeded = {'status': 'success', 'duration': 5, 'message': 'Clicked'}
+        failed = {'status': 'failed', 'duration': 5, 'message': 'Action failed: gone', 'error': 'gone'}
+
+        results = actions._in_browser_results(steps, [succeeded, succeeded, succeeded])
+        self.assertEqual((3, 3, 0, 0), (results.executed, results.successful, results.failed, results.skipped))
+        self.assertEqual('#b', results.details[1].selector)
+
+        # A failure stops the run like the WebDriver path, without reporting the rest
+        results = actions._in_browser_results(steps, [failed])
+        self.assertEqual((1, 0, 1, 0), (results.executed, results.successful, results.failed, results.skipped))
+        self.assertEqual('gone', results.details[0].error)
+
+        results = actions._in_browser_results(steps, [succeeded], 'navigated')
+        self.assertEqual(['success', 'failed', 'skipped'], [result.status for result in results.details])
+        self.assertEqual('navigated', results.details[1].error)
+
+    def test_interrupted_in_browser_run_reports_the_action_in_flight(self):
+        saved = [{'status': 'success', 'duration': 5, 'message': 'Clicked #a'}]
+
+        def async_script_handler(script, args):
+            raise TimeoutException("script timeout")
+
+        driver = FakeDriver(lambda script, args: json.dumps(saved), async_script_handler)
+        results = actions.execute_actions([
+            {'type': 'click', 'selector': '#a'},
+            {'type': 'click', 'selector': '#b'},
+            {'type': 'click', 'selector': '#c'},
+        ], driver, in_browser=True)
+
+        self.assertEqual(['success', 'failed', 'skipped'], [result.status for result in results.details])
+        self.assertEqual((2, 1, 1, 1), (results.executed, results.successful, results.failed, results.skipped))
+        self.assertEqual(30, driver.script_timeout)
+
+        # Nothing recovered, so only the first action is blamed
+        driver = FakeDriver(lambda script, args: None, async_script_handler)
+        results = actions.execute_actions([{'type': 'click', 'selector': '#a'}, {'type': 'press_enter'}],
+                                          driver, in_browser=True)
+        self.assertEqual(['failed', 'skipped'], [result.status for result in results.details])
+
+    def test_wait_timeouts_name_the_selector(self):
+        def find_element(by, value):
+            raise NoSuchElementException()
+
+        driver = FakeDriver()
+        driver.find_element = find_element
+        for state, message in (('present', 'Element not found: #gone'),
+                               ('visible', 'Element #gone not visible after 0.0s')):
+            result = actions._execute_single_action(driver, {'type': 'wait', 'for': {
+                'selector': '#gone', 'state': state, 'timeout': 0}}, 0)
+            self.assertEqual('failed', result.status)
+            self.assertIn(message, result.error)
+
+
+if __name__ == '__main__':
+    unittest.main()